@@ -0,0 +1,138 @@
+"""
+Compare memory use and runtime of the data feeds and Cerebro memory modes.
+
+Every combination runs in a fresh process so that peak memory is not shared
+between runs. Usage:
+
+    python benchmark_memory.py --bars 1000000
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_FEEDS = ('pandas', 'numpy')
+
+
+def peak_memory_mb():
+    """Peak resident memory of the current process in MB, or None if it cannot be measured"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.WinDLL('kernel32')
+        psapi = ctypes.WinDLL('psapi')
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / 2 ** 20
+
+    return None
+
+
+def make_bars(file_path, n_bars, seed=0):
+    """Write a random-walk M1 bar file for the benchmark"""
+    from utils.numpy_feed import save_bars
+
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-4, n_bars))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 5e-5, n_bars))
+    time_s = 1_577_836_800 + 60 * np.arange(n_bars, dtype=np.int64)
+    save_bars(file_path, time_s, open_, np.maximum(open_, close) + spread,
+              np.minimum(open_, close) - spread, close, rng.integers(1, 100, n_bars))
+
+
+def run_child(feed, mode, file_path):
+    """Run one backtest and report its runtime and peak memory as JSON"""
+    import pandas as pd
+    import backtrader as bt
+
+    from main import run_backtest, MEMORY_MODES
+    from utils.numpy_feed import load_bars
+
+    start = time.perf_counter()
+    bars = load_bars(file_path)
+    if feed == 'pandas':
+        df = pd.DataFrame({name: bars[name] for name in ('open', 'high', 'low', 'close', 'volume')},
+                          index=pd.to_datetime(bars['time'], unit='s'))
+        data_feed = bt.feeds.PandasData(dataname=df)
+    else:
+        from utils.data_loader import load_data_from_binary
+        data_feed = load_data_from_binary(file_path)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_backtest(data_feed, plot=False, **MEMORY_MODES[mode])
+
+    print(json.dumps({
+        'feed': feed,
+        'mode': mode,
+        'seconds': time.perf_counter() - start,
+        'peak_mb': peak_memory_mb(),
+    }))
+
+
+def main():
+    from main import MEMORY_MODES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bars', type=int, default=1_000_000, help='Number of M1 bars to generate')
+    parser.add_argument('--file', default=os.path.join('data', 'bench_bars.bin'), help='Bar file to use')
+    parser.add_argument('--child', nargs=2, metavar=('FEED', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.file)
+        return
+
+    os.makedirs(os.path.dirname(args.file) or '.', exist_ok=True)
+    make_bars(args.file, args.bars)
+
+    print(f"{'feed':<8} {'mode':<8} {'seconds':>10} {'peak MB':>10}")
+    for feed in BENCH_FEEDS:
+        for mode in MEMORY_MODES:
+            out = subprocess.run(
+                [sys.executable, __file__, '--file', args.file, '--child', feed, mode],
+                capture_output=True, text=True, check=True
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            peak = 'n/a' if result['peak_mb'] is None else f"{result['peak_mb']:.0f}"
+            print(f"{feed:<8} {mode:<8} {result['seconds']:>10.1f} {peak:>10}")
+
+
+if __name__ == "__main__":
+    main()
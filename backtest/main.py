@@ -1,25 +1,86 @@
+import itertools
 import os
 
 import backtrader as bt
 
 from strategies.cross_over import CrossOverStrategy
+from utils.analytics import EquityRecorder, compute_metrics
 from utils.data_loader import download_data_from_yahoo
+from utils.result_cache import ResultCache, hash_data_feed
 
+# Cerebro options for each memory mode, from fastest to leanest.
+# See benchmark_memory.py for measured memory and runtime of each.
+MEMORY_MODES = {
+    'full': dict(preload=True, runonce=True, exactbars=False),
+    'preload': dict(preload=True, runonce=False, exactbars=False),
+    'stream': dict(preload=False, runonce=False, exactbars=False),
+    'lowmem': dict(preload=False, runonce=False, exactbars=1),
+}
 
-def run_backtest(data_feed, strategy=CrossOverStrategy, **kwargs):
+# run_backtest options that do not change the results and are not passed to the strategy
+RUN_OPTIONS = ('preload', 'runonce', 'exactbars', 'plot')
+
+
+def summarize(strat):
+    """
+    Compute the performance metrics of a finished backtest
+
+    Args:
+        strat (bt.Strategy): Strategy instance returned by cerebro.run()
+
+    Returns:
+        dict: JSON-serializable results
+    """
+    return compute_metrics(strat.analyzers.equity.get_analysis())
+
+
+def print_summary(summary):
+    """Print the results returned by summarize"""
+    print('Final Portfolio Value: %.2f' % summary['final_value'])
+    print('Sharpe Ratio:', summary['sharpe'])
+    print('Sortino Ratio:', summary['sortino'])
+    print('DrawDown:', summary['drawdown'])
+    print('DrawDown Duration (bars):', summary['drawdown_bars'])
+    print('Return:', summary['return'])
+    print(f"Exposure: {summary['exposure'] * 100:.2f}%")
+
+    print("==== Trade Analysis ====")
+    print(f"Total Trades: {summary['total_trades']}")
+    print(f"Won: {summary['won']}")
+    print(f"Lost: {summary['lost']}")
+
+    if summary['won'] > 0:
+        print(f"Win Rate: {summary['win_rate'] * 100:.2f}%")
+    if summary['profit_factor'] is not None:
+        print(f"Profit Factor: {summary['profit_factor']:.2f}")
+
+
+def run_backtest(data_feed, strategy=CrossOverStrategy, preload=True, runonce=True, exactbars=False,
+                 plot=True, cash=100000.0, commission=0.001, **kwargs):
     """
     Run a backtest with the given data feed and strategy
 
+    The memory modes map straight to Cerebro's options (see MEMORY_MODES):
+    preload loads the whole feed before the run, runonce computes indicators
+    in vectorized batches, and exactbars >= 1 keeps only the bars the
+    indicators need (which disables preload, runonce and plotting).
+
     Args:
         data_feed (bt.feeds.DataBase): Data feed to use for the backtest
         strategy (bt.Strategy): Strategy to use for the backtest
+        preload (bool): Preload the data feed before running
+        runonce (bool): Calculate indicators in vectorized mode
+        exactbars (int or bool): Backtrader memory saving level (-2, -1, 0/False, 1, 2)
+        plot (bool): Plot the results (skipped when exactbars >= 1)
+        cash (float): Starting cash
+        commission (float): Commission per trade as a fraction of the trade value
         **kwargs: Additional arguments to pass to the strategy
 
     Returns:
         bt.Cerebro: Backtrader cerebro instance after running the backtest
     """
     # Create a cerebro entity
-    cerebro = bt.Cerebro()
+    cerebro = bt.Cerebro(preload=preload, runonce=runonce, exactbars=exactbars)
 
     # Add the data feed
     cerebro.adddata(data_feed)
@@ -28,16 +89,13 @@ def run_backtest(data_feed, strategy=CrossOverStrategy, **kwargs):
     cerebro.addstrategy(strategy, **kwargs)
 
     # Set our desired cash start
-    cerebro.broker.setcash(100000.0)
+    cerebro.broker.setcash(cash)
 
-    # Add analyzers
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-    cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
-    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    # Record the equity curve and trades - metrics are computed after the run
+    cerebro.addanalyzer(EquityRecorder, _name='equity')
 
-    # Set the commission - 0.1% per trade
-    cerebro.broker.setcommission(commission=0.001)
+    # Set the commission - 0.1% per trade by default
+    cerebro.broker.setcommission(commission=commission)
 
     # Print starting portfolio value
     print('Starting Portfolio Value: %.2f' % cerebro.broker.getvalue())
@@ -45,30 +103,86 @@ def run_backtest(data_feed, strategy=CrossOverStrategy, **kwargs):
     # Run the backtest
     results = cerebro.run()
 
-    # Print final portfolio value
-    print('Final Portfolio Value: %.2f' % cerebro.broker.getvalue())
+    # Extract and print results
+    print_summary(summarize(results[0]))
 
-    # Extract results
-    strat = results[0]
+    # Plot the results - needs the full line buffers
+    if plot and int(exactbars) < 1:
+        cerebro.plot(style='candlestick')
 
-    print('Sharpe Ratio:', strat.analyzers.sharpe.get_analysis()['sharperatio'])
-    print('DrawDown:', strat.analyzers.drawdown.get_analysis()['max']['drawdown'])
-    print('Return:', strat.analyzers.returns.get_analysis()['rtot'])
+    return cerebro
 
-    trade_analysis = strat.analyzers.trades.get_analysis()
 
-    print("==== Trade Analysis ====")
-    print(f"Total Trades: {trade_analysis.get('total', {}).get('total', 0)}")
-    print(f"Won: {trade_analysis.get('won', {}).get('total', 0)}")
-    print(f"Lost: {trade_analysis.get('lost', {}).get('total', 0)}")
+def run_cached_backtest(data_feed, strategy=CrossOverStrategy, cache=None, cash=100000.0, commission=0.001,
+                        data_hash=None, **kwargs):
+    """
+    Run a backtest, reusing the stored results if the same run was done before
 
-    if 'won' in trade_analysis and 'total' in trade_analysis['won'] and trade_analysis['won']['total'] > 0:
-        print(f"Win Rate: {trade_analysis['won']['total'] / trade_analysis['total']['total'] * 100:.2f}%")
+    Runs are identified by the input data, the strategy source and parameters
+    and the broker settings, so editing the strategy invalidates its results.
 
-    # Plot the results
-    cerebro.plot(style='candlestick')
+    Args:
+        data_feed (bt.feeds.DataBase): Data feed to use for the backtest
+        strategy (bt.Strategy): Strategy to use for the backtest
+        cache (ResultCache): Result cache (default: results/cache)
+        cash (float): Starting cash
+        commission (float): Commission per trade as a fraction of the trade value
+        data_hash (str): hash_data_feed of the data feed, computed when not given
+        **kwargs: Additional arguments to pass to run_backtest and the strategy
 
-    return cerebro
+    Returns:
+        dict: Results as returned by summarize
+    """
+    cache = cache or ResultCache()
+    run_kwargs = {name: kwargs.pop(name) for name in RUN_OPTIONS if name in kwargs}
+    key = cache.make_key(data_feed, strategy, cash, commission, data_hash=data_hash, **kwargs)
+
+    summary = cache.get(key)
+    if summary is not None:
+        print(f'Using cached results {key[:12]}')
+        print_summary(summary)
+        return summary
+
+    run_kwargs.setdefault('plot', False)
+    cerebro = run_backtest(data_feed, strategy=strategy, cash=cash, commission=commission, **run_kwargs, **kwargs)
+    summary = summarize(cerebro.runstrats[0][0])
+    cache.put(key, summary)
+
+    return summary
+
+
+def run_sweep(data_feed, param_grid, strategy=CrossOverStrategy, cache=None, **kwargs):
+    """
+    Run a backtest for every combination of strategy parameters
+
+    Finished runs are stored in the result cache as they complete, so an
+    interrupted sweep resumes where it stopped when started again.
+
+    Args:
+        data_feed (bt.feeds.DataBase): Data feed to use for the backtests
+        param_grid (dict): Strategy parameter name to list of values
+        strategy (bt.Strategy): Strategy to use for the backtests
+        cache (ResultCache): Result cache (default: results/cache)
+        **kwargs: Additional arguments to pass to run_cached_backtest
+
+    Returns:
+        list: (params, results) tuples, one per combination
+    """
+    cache = cache or ResultCache()
+    names = list(param_grid)
+    sweep = []
+
+    # The data is the same for every combination, so hash it only once
+    data_hash = hash_data_feed(data_feed)
+
+    for values in itertools.product(*(param_grid[name] for name in names)):
+        params = dict(zip(names, values))
+        print(f"==== {params} ====")
+        summary = run_cached_backtest(data_feed, strategy=strategy, cache=cache, data_hash=data_hash,
+                                      **params, **kwargs)
+        sweep.append((params, summary))
+
+    return sweep
 
 
 if __name__ == "__main__":
@@ -115,3 +229,18 @@ if __name__ == "__main__":
     else:
         print(f"CSV file {data_path} not found. Skipping this example.")
     """
+
+    # Example 3: Parameter sweep with cached results - rerunning skips finished combinations
+    """
+    print("\nRunning parameter sweep...")
+    cache = ResultCache(os.path.join('results', 'cache'))
+    sweep = run_sweep(
+        data_feed,
+        {'ma_short_period': [10, 20, 30], 'ma_long_period': [50, 100, 200]},
+        strategy=CrossOverStrategy,
+        cache=cache
+    )
+
+    # Keep the cache below 100 MB and drop results unused for 30 days
+    cache.evict(max_bytes=100 * 1024 * 1024, max_age=30 * 24 * 3600)
+    """
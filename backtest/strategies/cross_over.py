@@ -42,6 +42,7 @@ class CrossOverStrategy(bt.Strategy):
         self.order = None
         self.buyprice = None
         self.buycomm = None
+        self.last_dt = None
 
         # Add a CrossOver indicator
         self.crossover = bt.indicators.CrossOver(self.ma_short, self.ma_long)
@@ -88,6 +89,8 @@ class CrossOverStrategy(bt.Strategy):
         self.log(f'OPERATION PROFIT, GROSS: {trade.pnl:.2f}, NET: {trade.pnlcomm:.2f}')
 
     def next(self):
+        self.last_dt = self.datas[0].datetime[0]
+
         # Log the closing price of the series
         self.log(f'Close: {self.dataclose[0]:.2f}')
 
@@ -109,7 +112,9 @@ class CrossOverStrategy(bt.Strategy):
                 self.order = self.sell()  # Keep track of the created order
 
     def stop(self):
+        # With exactbars >= 1 the data buffer may already be empty here, so use the last bar seen
+        dt = self.datas[0].num2date(self.last_dt).date() if self.last_dt is not None else None
         self.log('MA Short Period: {}, MA Long Period: {}'.format(
             self.params.ma_short_period, self.params.ma_long_period
-        ), doprint=True)
-        self.log('(MA Strategy) Ending Value: %.2f' % self.broker.getvalue(), doprint=True)
+        ), dt=dt, doprint=True)
+        self.log('(MA Strategy) Ending Value: %.2f' % self.broker.getvalue(), dt=dt, doprint=True)
@@ -0,0 +1,138 @@
+import numpy as np
+from numba import njit
+
+# Integer state slots carried between chunks
+BAR_START = 0
+BAR_COUNT = 1
+POSITION = 2
+LAST_SIGN = 3
+N_FILLS = 4
+
+# Float state slots carried between chunks
+BAR_CLOSE = 0
+SHORT_SUM = 1
+LONG_SUM = 2
+ENTRY_PRICE = 3
+REALIZED_PNL = 4
+LAST_BID = 5
+
+
+class TickCrossOverState:
+    """
+    State of the tick-level crossover simulation between chunks.
+
+    The compiled kernel cannot hold on to Python objects, so everything it needs
+    to continue where the previous chunk stopped lives in a few small arrays.
+    Memory use is independent of the number of ticks processed.
+    """
+
+    def __init__(self, ma_long_period):
+        self.closes = np.zeros(ma_long_period, dtype=np.float64)
+        self.istate = np.zeros(5, dtype=np.int64)
+        self.istate[BAR_START] = -1
+        self.fstate = np.zeros(6, dtype=np.float64)
+
+    @property
+    def position(self):
+        return int(self.istate[POSITION])
+
+    @property
+    def entry_price(self):
+        return float(self.fstate[ENTRY_PRICE])
+
+    @property
+    def realized_pnl(self):
+        return float(self.fstate[REALIZED_PNL])
+
+    @property
+    def last_bid(self):
+        return float(self.fstate[LAST_BID])
+
+
+@njit(cache=True)
+def simulate_chunk(time_msc, bid, ask, bar_msc, ma_short_period, ma_long_period,
+                   units, slippage, slippage_spread_frac, commission,
+                   closes, istate, fstate,
+                   fill_time, fill_side, fill_price, fill_pnl):
+    """
+    Run the crossover rules over one chunk of ticks.
+
+    Bars are built from the bid price. When the first tick of a new bar arrives
+    the previous bar is closed, the moving averages are updated and a crossover
+    sends a market order that fills on that same tick: buys at the ask and sells
+    at the bid, both moved against us by the slippage model.
+
+    Fills are written to the fill_* arrays, which must be able to hold one fill
+    per bar boundary in the chunk. Buy fills have a PnL of zero and sell fills
+    the net PnL of the whole round trip. Returns the number of fills written.
+    """
+    istate[N_FILLS] = 0
+
+    for i in range(time_msc.shape[0]):
+        t = time_msc[i]
+        b = bid[i]
+        a = ask[i]
+        bar_start = t - t % bar_msc
+
+        if istate[BAR_START] == -1:
+            istate[BAR_START] = bar_start
+
+        elif bar_start != istate[BAR_START]:
+            # Close the previous bar and update the moving average sums
+            close = fstate[BAR_CLOSE]
+            n = istate[BAR_COUNT]
+            if n >= ma_short_period:
+                fstate[SHORT_SUM] -= closes[(n - ma_short_period) % ma_long_period]
+            if n >= ma_long_period:
+                fstate[LONG_SUM] -= closes[n % ma_long_period]
+            closes[n % ma_long_period] = close
+            fstate[SHORT_SUM] += close
+            fstate[LONG_SUM] += close
+            n += 1
+            istate[BAR_COUNT] = n
+            istate[BAR_START] = bar_start
+
+            if n >= ma_long_period:
+                diff = fstate[SHORT_SUM] / ma_short_period - fstate[LONG_SUM] / ma_long_period
+                sign = 0
+                if diff > 0:
+                    sign = 1
+                elif diff < 0:
+                    sign = -1
+
+                slip = slippage + slippage_spread_frac * (a - b)
+                k = istate[N_FILLS]
+
+                if sign > 0 and istate[LAST_SIGN] < 0 and istate[POSITION] == 0:
+                    price = a + slip
+                    istate[POSITION] = 1
+                    fstate[ENTRY_PRICE] = price
+                    fstate[REALIZED_PNL] -= commission
+                    fill_time[k] = t
+                    fill_side[k] = 1
+                    fill_price[k] = price
+                    fill_pnl[k] = 0.0
+                    istate[N_FILLS] = k + 1
+
+                elif sign < 0 and istate[LAST_SIGN] > 0 and istate[POSITION] == 1:
+                    price = b - slip
+                    pnl = (price - fstate[ENTRY_PRICE]) * units - commission
+                    istate[POSITION] = 0
+                    fstate[REALIZED_PNL] += pnl
+                    fill_time[k] = t
+                    fill_side[k] = -1
+                    fill_price[k] = price
+                    # The closing fill carries the round trip, including the entry commission
+                    fill_pnl[k] = pnl - commission
+                    istate[N_FILLS] = k + 1
+
+                # Like backtrader's CrossOver, a zero difference keeps the last sign
+                if sign != 0:
+                    istate[LAST_SIGN] = sign
+
+        fstate[BAR_CLOSE] = b
+
+    if time_msc.shape[0] > 0:
+        fstate[LAST_BID] = bid[time_msc.shape[0] - 1]
+
+    return istate[N_FILLS]
@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from strategies.tick_cross_over import TickCrossOverState, simulate_chunk
+from utils.tick_data import load_ticks, iter_tick_chunks
+
+
+def run_tick_backtest(tick_path, ma_short_period=20, ma_long_period=50, timeframe=3600,
+                      lot_size=0.1, contract_size=100000, slippage=0.0, slippage_spread_frac=0.0,
+                      commission_per_lot=0.0, cash=100000.0, chunk_size=5_000_000, printlog=False):
+    """
+    Run the crossover strategy on bid/ask ticks with spread and slippage
+
+    Ticks are streamed from a memory-mapped tick file in chunks, so memory use is
+    bounded by chunk_size no matter how large the file is. Bars are aggregated on
+    the fly from the bid price and market orders fill at the ask (buys) or the bid
+    (sells) of the first tick after the signal bar closes.
+
+    Slippage is applied against every fill and is slippage + slippage_spread_frac * spread,
+    both expressed in price units.
+
+    Args:
+        tick_path (str): Path to a binary tick file (see utils.tick_data)
+        ma_short_period (int): Period of the short moving average
+        ma_long_period (int): Period of the long moving average
+        timeframe (int): Bar length in seconds (default: 3600, H1)
+        lot_size (float): Trade size in lots
+        contract_size (float): Units per lot
+        slippage (float): Fixed slippage per fill in price units
+        slippage_spread_frac (float): Extra slippage per fill as a fraction of the current spread
+        commission_per_lot (float): Commission per lot per side in account currency
+        cash (float): Starting cash
+        chunk_size (int): Number of ticks processed per chunk
+        printlog (bool): Print every fill
+
+    Returns:
+        dict: Final value, realized PnL, number of ticks and a DataFrame of fills
+            (sell fills carry the net PnL of the round trip, commissions included)
+    """
+    if ma_short_period < 1 or ma_long_period < 1:
+        raise ValueError("ma_short_period and ma_long_period must be at least 1")
+    if ma_short_period > ma_long_period:
+        raise ValueError("ma_short_period must not be greater than ma_long_period")
+    if timeframe < 1:
+        raise ValueError("timeframe must be at least 1 second")
+
+    ticks = load_ticks(tick_path)
+    state = TickCrossOverState(ma_long_period)
+    bar_msc = int(timeframe) * 1000
+    units = lot_size * contract_size
+    commission = commission_per_lot * lot_size
+
+    fills = []
+    last_time = None
+    for time_msc, bid, ask in iter_tick_chunks(ticks, chunk_size):
+        if (last_time is not None and time_msc[0] < last_time) or np.any(np.diff(time_msc) < 0):
+            raise ValueError(f"Ticks in {tick_path} are not sorted by time_msc")
+        last_time = time_msc[-1]
+
+        # At most one fill per bar boundary, plus one for the bar carried over
+        capacity = int((time_msc[-1] - time_msc[0]) // bar_msc) + 2
+        fill_time = np.empty(capacity, dtype=np.int64)
+        fill_side = np.empty(capacity, dtype=np.int8)
+        fill_price = np.empty(capacity, dtype=np.float64)
+        fill_pnl = np.empty(capacity, dtype=np.float64)
+
+        n = simulate_chunk(
+            time_msc, bid, ask, bar_msc, ma_short_period, ma_long_period,
+            units, slippage, slippage_spread_frac, commission,
+            state.closes, state.istate, state.fstate,
+            fill_time, fill_side, fill_price, fill_pnl
+        )
+
+        if n:
+            fills.append(pd.DataFrame({
+                'time': pd.to_datetime(fill_time[:n], unit='ms'),
+                'side': np.where(fill_side[:n] > 0, 'buy', 'sell'),
+                'price': fill_price[:n],
+                'pnl': fill_pnl[:n],
+            }))
+
+    df_fills = pd.concat(fills, ignore_index=True) if fills else pd.DataFrame(
+        columns=['time', 'side', 'price', 'pnl']
+    )
+
+    # Mark an open position to market at the last bid
+    open_pnl = 0.0
+    if state.position:
+        open_pnl = (state.last_bid - state.entry_price) * units
+
+    final_value = cash + state.realized_pnl + open_pnl
+
+    if printlog:
+        for row in df_fills.itertuples():
+            print(f'{row.time.isoformat()} {row.side.upper()} EXECUTED, Price: {row.price:.5f}, PnL: {row.pnl:.2f}')
+
+    print('Starting Portfolio Value: %.2f' % cash)
+    print('Final Portfolio Value: %.2f' % final_value)
+
+    closed = df_fills[df_fills['side'] == 'sell']
+    won = int((closed['pnl'] > 0).sum())
+
+    print("==== Trade Analysis ====")
+    print(f"Ticks Processed: {len(ticks)}")
+    print(f"Total Trades: {len(closed)}")
+    print(f"Won: {won}")
+    print(f"Lost: {len(closed) - won}")
+
+    if won > 0:
+        print(f"Win Rate: {won / len(closed) * 100:.2f}%")
+
+    return {
+        'final_value': final_value,
+        'realized_pnl': state.realized_pnl,
+        'ticks': len(ticks),
+        'fills': df_fills,
+    }
+
+
+if __name__ == "__main__":
+    tick_path = os.path.join('data', 'EURUSD_ticks.bin')
+
+    if os.path.exists(tick_path):
+        print("Running tick backtest...")
+        run_tick_backtest(
+            tick_path,
+            ma_short_period=20,
+            ma_long_period=50,
+            timeframe=3600,
+            lot_size=0.1,
+            slippage=0.00001,
+            slippage_spread_frac=0.5,
+            printlog=True
+        )
+    else:
+        print(f"Tick file {tick_path} not found. Convert a tick export with utils.tick_data first.")
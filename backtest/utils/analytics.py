@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import backtrader as bt
+
+from utils.numpy_feed import EPOCH_NUM, SECONDS_PER_DAY
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+class EquityRecorder(bt.Analyzer):
+    """
+    Record the equity curve, position and closed trades of a run.
+
+    This is the only analyzer attached by run_backtest. It does the minimum
+    per bar (three appends) and leaves every metric to compute_metrics, which
+    runs once over the recorded arrays after the backtest.
+    """
+
+    def start(self):
+        self.times = []
+        self.equity = []
+        self.position = []
+        self.trades = []
+
+    def next(self):
+        self.times.append(self.data.datetime[0])
+        self.equity.append(self.strategy.broker.getvalue())
+        self.position.append(self.strategy.position.size)
+
+    def notify_trade(self, trade):
+        if trade.isclosed:
+            self.trades.append((trade.dtopen, trade.dtclose, trade.barlen, trade.pnl, trade.pnlcomm))
+
+    def get_analysis(self):
+        return {
+            'start_value': self.strategy.broker.startingcash,
+            'times': np.asarray(self.times, dtype=np.float64),
+            'equity': np.asarray(self.equity, dtype=np.float64),
+            'position': np.asarray(self.position, dtype=np.float64),
+            'trades': pd.DataFrame(self.trades, columns=['dtopen', 'dtclose', 'barlen', 'pnl', 'pnlcomm']),
+        }
+
+
+def periods_per_year(times):
+    """
+    Estimate the number of bars per year from backtrader datetimes (in days)
+
+    Args:
+        times (np.ndarray): Bar datetimes as backtrader floats
+
+    Returns:
+        float: Bars per year, based on the median bar spacing
+    """
+    if len(times) < 2:
+        return float(TRADING_DAYS_PER_YEAR)
+
+    spacing = np.median(np.diff(times))
+    if spacing <= 0:
+        return float(TRADING_DAYS_PER_YEAR)
+
+    # Up to daily bars count trading days, longer bars count calendar days
+    return TRADING_DAYS_PER_YEAR / spacing if spacing <= 1 else 365.25 / spacing
+
+
+def drawdown(equity):
+    """
+    Compute the drawdown series of an equity curve
+
+    Args:
+        equity (np.ndarray): Account value per bar
+
+    Returns:
+        tuple: (drawdown in percent per bar, bars since the last equity peak)
+    """
+    peak = np.maximum.accumulate(equity)
+    dd = (peak - equity) / peak * 100
+
+    index = np.arange(len(equity))
+    last_peak = np.maximum.accumulate(np.where(equity >= peak, index, 0))
+
+    return dd, index - last_peak
+
+
+def compute_metrics(analysis, ppy=None):
+    """
+    Compute performance metrics from an EquityRecorder analysis in one vectorized pass
+
+    Args:
+        analysis (dict): Result of EquityRecorder.get_analysis()
+        ppy (float): Bars per year for annualization (default: estimated from the bar spacing)
+
+    Returns:
+        dict: JSON-serializable metrics
+    """
+    if len(analysis['equity']) == 0:
+        raise ValueError("No bars were recorded")
+
+    # Start from the initial cash so the first bar's return and drawdown count
+    equity = np.concatenate(([analysis['start_value']], analysis['equity']))
+    pnl = analysis['trades']['pnlcomm'].to_numpy()
+
+    ppy = ppy or periods_per_year(analysis['times'])
+    returns = np.diff(equity) / equity[:-1]
+
+    sharpe = None
+    sortino = None
+    if len(returns) > 1:
+        std = returns.std(ddof=1)
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        mean = returns.mean()
+        sharpe = float(mean / std * np.sqrt(ppy)) if std > 0 else None
+        sortino = float(mean / downside * np.sqrt(ppy)) if downside > 0 else None
+
+    dd, dd_bars = drawdown(equity)
+
+    won = int((pnl > 0).sum())
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl < 0].sum()
+
+    return {
+        'start_value': float(equity[0]),
+        'final_value': float(equity[-1]),
+        'return': float(np.log(equity[-1] / equity[0])),
+        'sharpe': sharpe,
+        'sortino': sortino,
+        'drawdown': float(dd.max()),
+        'drawdown_bars': int(dd_bars.max()),
+        'exposure': float(np.mean(analysis['position'] != 0)),
+        'total_trades': len(pnl),
+        'won': won,
+        'lost': len(pnl) - won,
+        'win_rate': won / len(pnl) if len(pnl) else None,
+        'profit_factor': float(gross_profit / gross_loss) if gross_loss > 0 else None,
+    }
+
+
+def rolling_metrics(analysis, window, ppy=None):
+    """
+    Compute rolling return, volatility, Sharpe ratio and drawdown over a window of bars
+
+    Args:
+        analysis (dict): Result of EquityRecorder.get_analysis()
+        window (int): Window length in bars
+        ppy (float): Bars per year for annualization (default: estimated from the bar spacing)
+
+    Returns:
+        pd.DataFrame: One row per bar indexed by datetime, NaN until the window is full
+    """
+    ppy = ppy or periods_per_year(analysis['times'])
+    index = pd.to_datetime(np.round((analysis['times'] - EPOCH_NUM) * SECONDS_PER_DAY * 1000).astype(np.int64), unit='ms')
+    equity = pd.Series(analysis['equity'], index=index)
+
+    returns = equity.pct_change()
+    mean = returns.rolling(window).mean()
+    std = returns.rolling(window).std()
+    peak = equity.rolling(window).max()
+
+    return pd.DataFrame({
+        'return': equity.pct_change(window),
+        'volatility': std * np.sqrt(ppy),
+        'sharpe': (mean / std.where(std > 0)) * np.sqrt(ppy),
+        'drawdown': (peak - equity) / peak * 100,
+    })
+
+
+def metrics_table(runs):
+    """
+    Collect the metrics of many runs into a columnar table
+
+    Args:
+        runs (list): (params, metrics) tuples, e.g. from run_sweep
+
+    Returns:
+        pd.DataFrame: One row per run, one column per parameter and metric
+    """
+    return pd.DataFrame([{**params, **metrics} for params, metrics in runs])
+
+
+def save_metrics(table, file_path):
+    """
+    Save a metrics table as compressed columns (one NumPy array per column)
+
+    Args:
+        table (pd.DataFrame): Table from metrics_table
+        file_path (str): Path to the .npz file
+    """
+    np.savez_compressed(file_path, **{name: table[name].to_numpy() for name in table.columns})
+
+
+def load_metrics(file_path):
+    """
+    Load a metrics table saved with save_metrics
+
+    Args:
+        file_path (str): Path to the .npz file
+
+    Returns:
+        pd.DataFrame: Metrics table
+    """
+    with np.load(file_path, allow_pickle=True) as columns:
+        return pd.DataFrame({name: columns[name] for name in columns.files})
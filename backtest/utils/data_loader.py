@@ -4,6 +4,8 @@ import pandas as pd
 import datetime as dt
 import yfinance as yf
 
+from utils.numpy_feed import NumpyData, load_bars
+
 
 def load_data_from_csv(file_path, date_format='%Y-%m-%d'):
     """
@@ -74,3 +76,37 @@ def download_data_from_yahoo(symbol, start_date, end_date, timeframe='1d'):
     data_feed = bt.feeds.PandasData(dataname=data_single_level)
 
     return data_feed
+
+
+def load_data_from_numpy(time, open_, high, low, close, volume=None, **kwargs):
+    """
+    Create a Backtrader data feed from NumPy arrays without going through pandas
+
+    Args:
+        time (np.ndarray): Bar open times in seconds since the epoch
+        open_, high, low, close (np.ndarray): Bar prices
+        volume (np.ndarray): Bar volumes (optional)
+        **kwargs: Additional arguments to pass to the data feed (fromdate, todate, ...)
+
+    Returns:
+        NumpyData: Backtrader data feed
+    """
+    columns = {'time': time, 'open': open_, 'high': high, 'low': low, 'close': close}
+    if volume is not None:
+        columns['volume'] = volume
+
+    return NumpyData(dataname=columns, **kwargs)
+
+
+def load_data_from_binary(file_path, **kwargs):
+    """
+    Create a Backtrader data feed from a memory-mapped binary bar file
+
+    Args:
+        file_path (str): Path to a bar file written with utils.numpy_feed.save_bars
+        **kwargs: Additional arguments to pass to the data feed (fromdate, todate, ...)
+
+    Returns:
+        NumpyData: Backtrader data feed
+    """
+    return NumpyData(dataname=load_bars(file_path), **kwargs)
@@ -0,0 +1,137 @@
+import datetime as dt
+import os
+
+import backtrader as bt
+import numpy as np
+
+# On-disk layout of a bar file: a flat array of fixed-size records, no header.
+# time is in seconds since the epoch, like the rates returned by MetaTrader5.copy_rates_*.
+BAR_DTYPE = np.dtype([
+    ('time', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+# Backtrader datetime value of 1970-01-01 (days since 0001-01-01, plus one)
+EPOCH_NUM = bt.date2num(dt.datetime(1970, 1, 1))
+SECONDS_PER_DAY = 86400.0
+
+PRICE_LINES = ('open', 'high', 'low', 'close', 'volume', 'openinterest')
+
+
+class NumpyData(bt.feed.DataBase):
+    """
+    Backtrader data feed reading bars straight from NumPy arrays.
+
+    ``dataname`` is either a structured array (for example a memory-mapped bar
+    file from load_bars) or a dict of 1-D arrays. It must provide a ``time``
+    column with epoch seconds and the price columns; ``volume`` and
+    ``openinterest`` are optional.
+
+    Unlike PandasData no DataFrame is built and bars are not looked up row by
+    row through pandas. When Cerebro preloads, the columns are copied into the
+    line buffers in one go. Without preload only the current bar is read, so a
+    memory-mapped file is paged in lazily and memory stays bounded by exactbars.
+    """
+
+    def start(self):
+        super(NumpyData, self).start()
+
+        data = self.p.dataname
+        names = data.dtype.names if isinstance(data, np.ndarray) else tuple(data.keys())
+        if 'time' not in names:
+            raise ValueError("NumpyData requires a 'time' column with epoch seconds")
+
+        self._time = data['time']
+        self._columns = [(alias, data[alias]) for alias in PRICE_LINES if alias in names]
+        self._size = len(self._time)
+        self._idx = -1
+
+    def preload(self):
+        # Filters and input timezones need the bar-by-bar path
+        if self._filters or self._tzinput:
+            return super(NumpyData, self).preload()
+
+        dtnum = self._time / SECONDS_PER_DAY + EPOCH_NUM
+        start = np.searchsorted(dtnum, self.fromdate, side='left')
+        end = np.searchsorted(dtnum, self.todate, side='right')
+
+        self.lines.datetime.array.frombytes(np.ascontiguousarray(dtnum[start:end], dtype=np.float64).tobytes())
+        for alias, column in self._columns:
+            getattr(self.lines, alias).array.frombytes(
+                np.ascontiguousarray(column[start:end], dtype=np.float64).tobytes()
+            )
+
+        # Lines without a source column are filled like backtrader does for missing data
+        missing = np.full(end - start, np.nan).tobytes()
+        present = {alias for alias, _ in self._columns}
+        for alias in PRICE_LINES:
+            if alias not in present:
+                getattr(self.lines, alias).array.frombytes(missing)
+
+        self._idx = self._size
+        self.home()
+
+    def _load(self):
+        self._idx += 1
+        if self._idx >= self._size:
+            return False
+
+        i = self._idx
+        self.lines.datetime[0] = self._time[i] / SECONDS_PER_DAY + EPOCH_NUM
+        for alias, column in self._columns:
+            getattr(self.lines, alias)[0] = column[i]
+
+        return True
+
+
+def save_bars(file_path, time, open_, high, low, close, volume=None):
+    """
+    Write bars to a binary bar file
+
+    Args:
+        file_path (str): Path to the bar file
+        time (array-like): Bar open times in seconds since the epoch
+        open_, high, low, close (array-like): Bar prices
+        volume (array-like): Bar volumes (default: zeros)
+
+    Returns:
+        int: Number of bars written
+    """
+    records = np.zeros(len(time), dtype=BAR_DTYPE)
+    records['time'] = time
+    records['open'] = open_
+    records['high'] = high
+    records['low'] = low
+    records['close'] = close
+    if volume is not None:
+        records['volume'] = volume
+
+    records.tofile(file_path)
+
+    return len(records)
+
+
+def load_bars(file_path):
+    """
+    Memory-map a binary bar file
+
+    Args:
+        file_path (str): Path to the bar file
+
+    Returns:
+        np.memmap: Read-only structured array with BAR_DTYPE fields
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found")
+
+    size = os.path.getsize(file_path)
+    if size % BAR_DTYPE.itemsize:
+        raise ValueError(f"File {file_path} is not a valid bar file")
+    if size == 0:
+        return np.empty(0, dtype=BAR_DTYPE)
+
+    return np.memmap(file_path, dtype=BAR_DTYPE, mode='r')
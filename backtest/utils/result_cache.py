@@ -0,0 +1,191 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Bump when the layout of cached results changes to invalidate old entries
+CACHE_VERSION = 2
+
+
+def hash_data_feed(data_feed):
+    """
+    Hash the contents and parameters of a Backtrader data feed
+
+    Supports feeds whose dataname is a DataFrame (PandasData), a structured
+    NumPy array or a dict of arrays (NumpyData) and a file path (CSV feeds).
+
+    Args:
+        data_feed (bt.feeds.DataBase): Data feed to hash
+
+    Returns:
+        str: Hex digest identifying the data
+    """
+    h = hashlib.sha256()
+    h.update(type(data_feed).__name__.encode())
+
+    data = data_feed.p.dataname
+    if isinstance(data, pd.DataFrame):
+        h.update(repr(list(data.columns)).encode())
+        h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        h.update(repr(data.dtype.descr).encode())
+        h.update(np.ascontiguousarray(data).data)
+    elif isinstance(data, dict):
+        for name in sorted(data):
+            column = np.ascontiguousarray(data[name])
+            h.update(name.encode())
+            h.update(column.dtype.str.encode())
+            h.update(column.data)
+    elif isinstance(data, str) and os.path.exists(data):
+        with open(data, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    else:
+        raise TypeError(f"Cannot hash data feed with dataname of type {type(data).__name__}")
+
+    # Feed parameters such as fromdate/todate change what the strategy sees
+    feed_params = {name: value for name, value in data_feed.p._getkwargs().items() if name != 'dataname'}
+    h.update(repr(sorted(feed_params.items())).encode())
+
+    return h.hexdigest()
+
+
+def hash_strategy(strategy, **kwargs):
+    """
+    Hash the source code and effective parameters of a Backtrader strategy
+
+    Args:
+        strategy (bt.Strategy): Strategy class
+        **kwargs: Parameters passed to the strategy
+
+    Returns:
+        str: Hex digest identifying the strategy version and parameters
+    """
+    params = dict(strategy.params._getitems())
+    params.update(kwargs)
+
+    h = hashlib.sha256()
+    h.update(inspect.getsource(strategy).encode())
+    h.update(repr(sorted(params.items())).encode())
+
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Local content-addressed store for backtest results.
+
+    Each entry is a small JSON file named after the hash of everything that
+    determines the result: the input data, the strategy source and parameters
+    and the broker settings. Entries are written atomically, so a sweep that is
+    interrupted can simply be started again and will skip finished runs.
+
+    Args:
+        - cache_dir (str): Directory holding the cache entries.
+    """
+
+    def __init__(self, cache_dir=os.path.join('results', 'cache')):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, data_feed, strategy, cash, commission, data_hash=None, **kwargs):
+        """
+        Build the cache key of a backtest
+
+        Args:
+            data_feed (bt.feeds.DataBase): Data feed used for the backtest
+            strategy (bt.Strategy): Strategy class used for the backtest
+            cash (float): Starting cash
+            commission (float): Commission per trade
+            data_hash (str): hash_data_feed of the feed, if already known. Hashing a large
+                feed reads all of it, so pass this when building many keys for one feed.
+            **kwargs: Parameters passed to the strategy
+
+        Returns:
+            str: Hex digest key
+        """
+        if data_hash is None:
+            data_hash = hash_data_feed(data_feed)
+
+        h = hashlib.sha256()
+        h.update(str(CACHE_VERSION).encode())
+        h.update(data_hash.encode())
+        h.update(hash_strategy(strategy, **kwargs).encode())
+        h.update(repr((float(cash), float(commission))).encode())
+
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def get(self, key):
+        """
+        Return the cached results for a key, or None if there are none
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                results = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Refresh the modification time so size eviction drops least recently used entries first
+        os.utime(path)
+        return results
+
+    def put(self, key, results):
+        """
+        Store results for a key
+
+        Args:
+            key (str): Key from make_key
+            results (dict): JSON-serializable backtest results
+        """
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(results, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def evict(self, max_bytes=None, max_age=None):
+        """
+        Remove cache entries by age and/or total size
+
+        Args:
+            max_bytes (int): Remove least recently used entries until the cache is at most this size
+            max_age (float): Remove entries not used for more than this many seconds
+
+        Returns:
+            int: Number of entries removed
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Oldest first
+        entries.sort()
+        removed = 0
+        now = time.time()
+
+        if max_age is not None:
+            while entries and now - entries[0][0] > max_age:
+                os.remove(entries.pop(0)[2])
+                removed += 1
+
+        if max_bytes is not None:
+            total = sum(size for _, size, _ in entries)
+            while entries and total > max_bytes:
+                _, size, path = entries.pop(0)
+                os.remove(path)
+                total -= size
+                removed += 1
+
+        return removed
@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# On-disk layout of a tick file: a flat array of fixed-size records, no header.
+# time_msc matches the millisecond timestamp returned by MetaTrader5.copy_ticks_*.
+TICK_DTYPE = np.dtype([
+    ('time_msc', '<i8'),
+    ('bid', '<f8'),
+    ('ask', '<f8'),
+])
+
+
+def write_ticks(file_path, time_msc, bid, ask, append=False):
+    """
+    Write bid/ask ticks to a binary tick file
+
+    Args:
+        file_path (str): Path to the tick file
+        time_msc (array-like): Tick timestamps in milliseconds since the epoch
+        bid (array-like): Bid prices
+        ask (array-like): Ask prices
+        append (bool): Append to an existing file instead of overwriting it
+
+    Returns:
+        int: Number of ticks written
+    """
+    records = np.empty(len(time_msc), dtype=TICK_DTYPE)
+    records['time_msc'] = time_msc
+    records['bid'] = bid
+    records['ask'] = ask
+
+    with open(file_path, 'ab' if append else 'wb') as f:
+        records.tofile(f)
+
+    return len(records)
+
+
+def convert_csv_to_ticks(csv_path, file_path, chunksize=1_000_000):
+    """
+    Convert a CSV export of ticks (time_msc, bid, ask columns) to a binary tick file
+
+    The CSV is read in chunks so that arbitrarily large exports can be converted
+    without loading them into memory.
+
+    Args:
+        csv_path (str): Path to the CSV file
+        file_path (str): Path to the binary tick file to create
+        chunksize (int): Number of rows to read per chunk
+
+    Returns:
+        int: Number of ticks written
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"File {csv_path} not found")
+
+    total = 0
+    reader = pd.read_csv(csv_path, usecols=['time_msc', 'bid', 'ask'], chunksize=chunksize)
+    for i, chunk in enumerate(reader):
+        total += write_ticks(
+            file_path,
+            chunk['time_msc'].to_numpy(),
+            chunk['bid'].to_numpy(),
+            chunk['ask'].to_numpy(),
+            append=i > 0
+        )
+
+    return total
+
+
+def load_ticks(file_path):
+    """
+    Memory-map a binary tick file
+
+    Nothing is read until the returned array is accessed, so the file can be much
+    larger than the available RAM.
+
+    Args:
+        file_path (str): Path to the tick file
+
+    Returns:
+        np.memmap: Read-only structured array with time_msc, bid and ask fields
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found")
+
+    size = os.path.getsize(file_path)
+    if size % TICK_DTYPE.itemsize:
+        raise ValueError(f"File {file_path} is not a valid tick file")
+    if size == 0:
+        return np.empty(0, dtype=TICK_DTYPE)
+
+    return np.memmap(file_path, dtype=TICK_DTYPE, mode='r')
+
+
+def iter_tick_chunks(ticks, chunk_size=5_000_000):
+    """
+    Iterate over a tick array in fixed-size chunks
+
+    Args:
+        ticks (np.ndarray): Structured tick array, usually from load_ticks
+        chunk_size (int): Number of ticks per chunk
+
+    Yields:
+        tuple: (time_msc, bid, ask) views for each chunk
+    """
+    for start in range(0, len(ticks), chunk_size):
+        chunk = ticks[start:start + chunk_size]
+        yield chunk['time_msc'], chunk['bid'], chunk['ask']
@@ -0,0 +1,58 @@
+"""
+Measure how long the CLI takes to start, compared with importing everything up front.
+
+Each command runs in a fresh interpreter several times and the median wall time
+is reported. The "eager imports" row is what every start cost before the lazy
+CLI, because the old main.py imported all of these modules before connecting.
+Usage:
+
+    python benchmark_startup.py --config robots.example.yaml --repeat 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+EAGER_IMPORTS = (
+    "import MetaTrader5, talib, pandas, loguru; "
+    "import mt5_trading.domain as d; d.MT5Trader; d.CrossOverStrategy; d.MT5Data; d.MT5AccountState; "
+    "import mt5_trading.robot.cross_over_robot"
+)
+
+
+def time_command(command, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+    return statistics.median(timings), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="robots.example.yaml", help="Config file to use")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command")
+    args = parser.parse_args()
+
+    commands = {
+        "python (baseline)": [sys.executable, "-c", "pass"],
+        "validate": [sys.executable, "-m", "mt5_trading", "validate", args.config],
+        "dry-run": [sys.executable, "-m", "mt5_trading", "dry-run", args.config],
+        "eager imports": [sys.executable, "-c", EAGER_IMPORTS],
+    }
+
+    print(f"{'command':<20} {'median ms':>10}")
+    for name, command in commands.items():
+        seconds, error = time_command(command, args.repeat)
+        if error:
+            print(f"{name:<20} {'failed':>10}  ({error})")
+        else:
+            print(f"{name:<20} {seconds * 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+
+from mt5_trading.cli import main
+
+sys.exit(main())
@@ -1,5 +1,6 @@
-__all__ = ["Trader", "TradingStrategy", "TradingData"]
+__all__ = ["Trader", "TradingStrategy", "TradingData", "AccountState"]
 
+from mt5_trading.adapters.account import AccountState
 from mt5_trading.adapters.data import TradingData
 from mt5_trading.adapters.strategy import TradingStrategy
 from mt5_trading.adapters.trader import Trader
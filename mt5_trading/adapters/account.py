@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class AccountState(ABC):
+    @abstractmethod
+    def sync(self):
+        raise NotImplemented
+
+    @abstractmethod
+    def get_balance(self):
+        raise NotImplemented
+
+    @abstractmethod
+    def count_positions(self, *args, **kwargs):
+        raise NotImplemented
+
+    @abstractmethod
+    def get_net_volume(self, *args, **kwargs):
+        raise NotImplemented
+
+    @abstractmethod
+    def get_currency_exposure(self, *args, **kwargs):
+        raise NotImplemented
+
+    @abstractmethod
+    def get_pending_volume(self, *args, **kwargs):
+        raise NotImplemented
+
+    @abstractmethod
+    def check_exposure(self, *args, **kwargs):
+        raise NotImplemented
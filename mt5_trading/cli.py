@@ -0,0 +1,338 @@
+"""
+Command line entry point for running trading robots from a config file.
+
+    python -m mt5_trading validate robots.yaml
+    python -m mt5_trading dry-run robots.yaml
+    python -m mt5_trading run robots.yaml
+
+Only the standard library is imported at startup. ``validate`` and ``dry-run``
+never import MetaTrader5, talib or pandas. ``run`` imports the strategies, data
+sources and robots that the config names, and connects to the terminal just
+before the first trade cycle.
+"""
+import argparse
+import ast
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+DEFAULT_CONFIG = "robots.yaml"
+
+# Short names usable in the config. Any "package.module:Class" path works as well.
+STRATEGIES = {
+    "cross_over": "mt5_trading.domain.strategies.cross_over_strategy:CrossOverStrategy",
+}
+DATA_SOURCES = {
+    "mt5": "mt5_trading.domain.data_sources.mt5_data:MT5Data",
+}
+ROBOTS = {
+    "cross_over": "mt5_trading.robot.cross_over_robot:CrossOverRobot",
+}
+
+# Names of the MetaTrader5.TIMEFRAME_* constants, checked without importing MetaTrader5
+TIMEFRAMES = {
+    "M1", "M2", "M3", "M4", "M5", "M6", "M10", "M12", "M15", "M20", "M30",
+    "H1", "H2", "H3", "H4", "H6", "H8", "H12", "D1", "W1", "MN1",
+}
+
+COMMANDS = {
+    "validate": "check the config file and exit",
+    "dry-run": "check the config and referenced modules and classes, show what would run, and exit",
+    "run": "connect to the terminal and start the robots",
+}
+
+# Optional per-robot limits, passed to MT5AccountState.check_exposure before each new position
+EXPOSURE_LIMITS = ("max_symbol_volume", "max_magic_volume", "max_currency_exposure")
+
+ROBOT_DEFAULTS = {
+    "robot": "cross_over",
+    "strategy": "cross_over",
+    "data_source": "mt5",
+    "timeframe": "H1",
+    "interval_minutes": 60,
+}
+
+
+class ConfigError(ValueError):
+    pass
+
+
+def load_config(path: str) -> dict:
+    """
+    Load and validate a robots config file.
+
+    Args:
+        - path (str): Path to the YAML config file.
+
+    Returns:
+        dict: Config with defaults applied to every robot.
+
+    Raises:
+        ConfigError: If the file is missing or invalid. The message lists every problem found.
+    """
+    import yaml
+
+    if not os.path.exists(path):
+        raise ConfigError(f"Config file {path} not found")
+
+    try:
+        with open(path) as f:
+            config = yaml.safe_load(f) or {}
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Could not parse YAML: {e}")
+
+    if not isinstance(config, dict):
+        raise ConfigError("The config must be a mapping with a 'robots' list")
+
+    errors = []
+    robots = config.get("robots")
+    if not isinstance(robots, list) or not robots:
+        errors.append("'robots' must be a non-empty list")
+        robots = []
+
+    names = set()
+    magic_numbers = set()
+    for i, robot in enumerate(robots):
+        if not isinstance(robot, dict):
+            errors.append(f"robots[{i}] must be a mapping")
+            continue
+        for key, value in ROBOT_DEFAULTS.items():
+            robot.setdefault(key, value)
+
+        name = robot.setdefault("name", f"robot{i}")
+        if not isinstance(name, str):
+            errors.append(f"robots[{i}]: 'name' must be a string")
+            name = f"robots[{i}]"
+        where = f"robot '{name}'"
+        if name in names:
+            errors.append(f"{where}: duplicate name")
+        names.add(name)
+
+        magic_number = robot.get("magic_number")
+        if not isinstance(magic_number, int) or isinstance(magic_number, bool) or magic_number <= 0:
+            errors.append(f"{where}: 'magic_number' must be a positive integer")
+        elif magic_number in magic_numbers:
+            errors.append(f"{where}: duplicate magic_number {magic_number}")
+        else:
+            magic_numbers.add(magic_number)
+
+        invalid = [key for key in ("robot", "strategy", "data_source", "timeframe") if not isinstance(robot[key], str)]
+        for key in invalid:
+            errors.append(f"{where}: '{key}' must be a string")
+
+        if not robot.get("symbol"):
+            errors.append(f"{where}: 'symbol' is required")
+        if not isinstance(robot.get("lot_size"), (int, float)) or robot["lot_size"] <= 0:
+            errors.append(f"{where}: 'lot_size' must be a positive number")
+        if "timeframe" not in invalid and robot["timeframe"] not in TIMEFRAMES:
+            errors.append(f"{where}: unknown timeframe '{robot['timeframe']}'")
+        if not isinstance(robot["interval_minutes"], (int, float)) or robot["interval_minutes"] <= 0:
+            errors.append(f"{where}: 'interval_minutes' must be a positive number")
+
+        exposure = robot.setdefault("exposure", {})
+        if not isinstance(exposure, dict):
+            errors.append(f"{where}: 'exposure' must be a mapping")
+        else:
+            for key, value in exposure.items():
+                if key not in EXPOSURE_LIMITS:
+                    errors.append(f"{where}: unknown exposure limit '{key}'")
+                elif not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                    errors.append(f"{where}: exposure limit '{key}' must be a positive number")
+
+        for key, registry in (("strategy", STRATEGIES), ("data_source", DATA_SOURCES), ("robot", ROBOTS)):
+            if key in invalid:
+                continue
+            target = registry.get(robot[key], robot[key])
+            if ":" not in target:
+                errors.append(f"{where}: unknown {key} '{robot[key]}'")
+
+    if errors:
+        raise ConfigError("\n".join(errors))
+
+    return config
+
+
+def _target(registry: dict, name: str) -> str:
+    return registry.get(name, name)
+
+
+def resolve(target: str):
+    """Import a "package.module:Class" path and return the class"""
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _defines(spec, name: str) -> bool:
+    """Check whether a module's source defines name at the top level, without importing it"""
+    if not spec.has_location or not spec.origin.endswith(".py"):
+        # Compiled modules cannot be parsed, so their names are checked by run
+        return True
+
+    with open(spec.origin, "rb") as f:
+        tree = ast.parse(f.read(), spec.origin)
+
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names = [node.name]
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names = [(alias.asname or alias.name).partition(".")[0] for alias in node.names]
+        elif isinstance(node, ast.Assign):
+            names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names = [node.target.id]
+        else:
+            continue
+        # A star import or a module level __getattr__ may provide any name
+        if name in names or "*" in names or "__getattr__" in names:
+            return True
+    return False
+
+
+def dry_run(config: dict) -> list[str]:
+    """
+    Check that every referenced module and class can be found and describe what run would do.
+
+    Modules are located with importlib.util.find_spec and their source is parsed
+    to find the class, neither of which executes them, so no terminal connection
+    is made and no heavy dependency is loaded.
+
+    Returns:
+        list: Missing modules and classes, empty if everything was found
+    """
+    missing = []
+    terminal_path = config.get("terminal_path") or os.getenv("TERMINAL_PATH")
+    print(f"Terminal: {terminal_path or '(default)'}")
+
+    for robot in config["robots"]:
+        targets = [
+            _target(STRATEGIES, robot["strategy"]),
+            _target(DATA_SOURCES, robot["data_source"]),
+            _target(ROBOTS, robot["robot"]),
+        ]
+        for target in targets:
+            module_name, _, attr = target.partition(":")
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except ModuleNotFoundError:
+                spec = None
+            if spec is None:
+                missing.append(module_name)
+            elif not _defines(spec, attr):
+                missing.append(target)
+
+        print(
+            f"{robot['name']}: {robot['robot']} robot, {robot['strategy']} strategy on "
+            f"{robot['symbol']} {robot['timeframe']} via {robot['data_source']}, "
+            f"{robot['lot_size']} lots every {robot['interval_minutes']} minutes, magic {robot['magic_number']}"
+        )
+
+    return missing
+
+
+def build_robots(config: dict) -> tuple:
+    """
+    Import the referenced classes, connect to the terminal and create the robots.
+
+    Returns:
+        tuple: Shared account state and a list of (robot config, robot instance) tuples
+    """
+    import MetaTrader5 as mt5
+
+    from mt5_trading.domain import MT5AccountState, MT5Trader
+
+    terminal_path = config.get("terminal_path") or os.getenv("TERMINAL_PATH")
+    login = os.getenv("LOGIN")
+    password = os.getenv("PASSWORD")
+    server = os.getenv("SERVER")
+
+    account_state = MT5AccountState()
+    trader = MT5Trader(account_state)
+
+    robots = []
+    for robot_config in config["robots"]:
+        data_class = resolve(_target(DATA_SOURCES, robot_config["data_source"]))
+        strategy_class = resolve(_target(STRATEGIES, robot_config["strategy"]))
+        robot_class = resolve(_target(ROBOTS, robot_config["robot"]))
+
+        time_frame = getattr(mt5, f"TIMEFRAME_{robot_config['timeframe']}")
+        data = data_class(login, server, password, terminal_path, robot_config["symbol"], time_frame)
+        strategy = strategy_class(data)
+        robot = robot_class(
+            robot_config["lot_size"], trader, strategy,
+            magic_number=robot_config["magic_number"], name=robot_config["name"],
+            account_state=account_state, exposure_limits=robot_config["exposure"]
+        )
+        robots.append((robot_config, robot))
+
+    return account_state, robots
+
+
+def run(config: dict) -> None:
+    """Create the robots and run each one on its own interval until interrupted"""
+    import sched
+
+    from loguru import logger
+
+    from mt5_trading.logging_config import configure_logging
+
+    configure_logging(config.get("log_path", "logs/log.txt"))
+
+    account_state, robots = build_robots(config)
+    scheduler = sched.scheduler(time.time, time.sleep)
+
+    def run_job(robot_config, robot):
+        try:
+            logger.info(f"Running scheduled trade cycle for {robot_config['name']}...")
+            account_state.sync()
+            robot.trade()
+            logger.info("Trade cycle completed.")
+        except Exception as e:
+            logger.exception(f"Scheduled job failed: {e}")
+        scheduler.enter(robot_config["interval_minutes"] * 60, 1, run_job, (robot_config, robot))
+
+    for robot_config, robot in robots:
+        scheduler.enter(0, 1, run_job, (robot_config, robot))
+
+    logger.info(f"Starting scheduler for {len(robots)} robot(s)...")
+    threading.Thread(target=scheduler.run, daemon=True).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.info("Shutting down scheduler...")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="mt5-trading", description="Run MetaTrader 5 trading robots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in COMMANDS.items():
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument("config", nargs="?", default=DEFAULT_CONFIG, help=f"config file (default: {DEFAULT_CONFIG})")
+
+    args = parser.parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+    except ConfigError as e:
+        print(f"Invalid config {args.config}:\n{e}", file=sys.stderr)
+        return 1
+
+    if args.command == "validate":
+        print(f"{args.config}: {len(config['robots'])} robot(s) OK")
+        return 0
+
+    if args.command == "dry-run":
+        missing = dry_run(config)
+        if missing:
+            print(f"Missing modules or classes: {', '.join(sorted(set(missing)))}", file=sys.stderr)
+            return 1
+        return 0
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    run(config)
+    return 0
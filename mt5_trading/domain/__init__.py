@@ -1,5 +1,24 @@
-from mt5_trading.domain.trader import MT5Trader
-from mt5_trading.domain.strategies.cross_over_strategy import CrossOverStrategy
-from mt5_trading.domain.data_sources.mt5_data import MT5Data
+import importlib
 
-__all__ = ["MT5Trader", "CrossOverStrategy", "MT5Data"]
+__all__ = ["MT5Trader", "CrossOverStrategy", "MT5Data", "MT5AccountState"]
+
+# Imported on first access so that importing one module of the package does not
+# pull in MetaTrader5, talib and pandas for all of them
+_LAZY_IMPORTS = {
+    "MT5Trader": "mt5_trading.domain.trader",
+    "CrossOverStrategy": "mt5_trading.domain.strategies.cross_over_strategy",
+    "MT5Data": "mt5_trading.domain.data_sources.mt5_data",
+    "MT5AccountState": "mt5_trading.domain.account_state",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
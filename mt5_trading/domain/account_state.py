@@ -0,0 +1,334 @@
+import time
+
+import MetaTrader5 as mt5
+import pandas as pd
+from loguru import logger
+
+from mt5_trading.adapters import AccountState
+
+# Seconds to look past the local clock, for servers ahead of the local time zone
+SERVER_CLOCK_MARGIN = 2 * 86400
+
+# Tries at taking a positions snapshot with no deal made while it was taken
+SEED_ATTEMPTS = 5
+
+PENDING_BUY_TYPES = (mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_BUY_STOP_LIMIT)
+PENDING_SELL_TYPES = (mt5.ORDER_TYPE_SELL_LIMIT, mt5.ORDER_TYPE_SELL_STOP, mt5.ORDER_TYPE_SELL_STOP_LIMIT)
+
+
+class MT5AccountState(AccountState):
+    """
+    MT5AccountState keeps a local view of the account, positions and exposure.
+
+    The first sync takes a snapshot of the open positions and sets a time_msc
+    cursor at the latest deal of the account, so the snapshot already includes
+    every deal up to the cursor. Every following sync only pulls the deals made
+    since then and applies them to the positions, the net volume per symbol and
+    per robot (magic number), and the net exposure per currency.
+
+    Each sync also reloads the pending orders and refreshes balance, equity and
+    margin with one account_info() call. Pending orders are not part of the net
+    exposure, but check_exposure counts those on the same side as the new order
+    as if they had filled.
+
+    Pre-trade checks then read these dictionaries without a terminal round trip,
+    so many robots can share one instance and one sync per cycle.
+
+    Args:
+        - lookback_days (int): How far back to look for the latest deal before searching the whole history.
+
+    Example usage:
+    ```python
+    account_state = MT5AccountState()
+    account_state.sync()
+
+    if account_state.check_exposure("EURUSD", 0.1, mt5.ORDER_TYPE_BUY, max_symbol_volume=1.0):
+        ...
+    ```
+    """
+
+    def __init__(self, lookback_days: int = 1) -> None:
+        self.lookback_days = lookback_days
+        self.positions: dict[int, dict] = {}
+        self.symbol_volume: dict[str, float] = {}
+        self.magic_volume: dict[tuple[int, str], float] = {}
+        self.currency_exposure: dict[str, float] = {}
+        self.pending_volume: dict[tuple[str, bool], float] = {}
+        self.pending_magic_volume: dict[tuple[int, str, bool], float] = {}
+        self.pending_exposure: dict[tuple[str, bool], float] = {}
+        self.balance = 0.0
+        self.equity = 0.0
+        self.margin = 0.0
+        self.margin_free = 0.0
+        self.cursor_msc: int | None = None
+        self._seen_at_cursor: set[int] = set()
+        self._symbols: dict[str, tuple[str, str, float]] = {}
+
+    def sync(self) -> int:
+        """
+        Apply the deals made since the last sync and refresh the pending orders and account figures.
+
+        Returns:
+            int: Number of trade deals applied
+        """
+        if self.cursor_msc is None:
+            self._seed()
+            self._refresh_orders()
+            self._refresh_account()
+            return 0
+
+        # Deal times are server epoch seconds. Passing integers avoids the
+        # local-time conversion of naive datetimes, and the server clock may be
+        # ahead of the local one, so look past "now"
+        deals = mt5.history_deals_get(self.cursor_msc // 1000, int(time.time()) + SERVER_CLOCK_MARGIN)
+        if deals is None:
+            logger.warning(f"Could not get deal history: {mt5.last_error()}")
+            return 0
+
+        applied = 0
+        for deal in sorted(deals, key=lambda d: (d.time_msc, d.ticket)):
+            if deal.time_msc < self.cursor_msc:
+                continue
+            if deal.time_msc == self.cursor_msc and deal.ticket in self._seen_at_cursor:
+                continue
+            if deal.time_msc > self.cursor_msc:
+                self.cursor_msc = deal.time_msc
+                self._seen_at_cursor = set()
+            self._seen_at_cursor.add(deal.ticket)
+
+            if deal.type in (mt5.DEAL_TYPE_BUY, mt5.DEAL_TYPE_SELL):
+                signed = deal.volume if deal.type == mt5.DEAL_TYPE_BUY else -deal.volume
+                self._apply(deal.position_id, deal.symbol, deal.magic, signed, deal.price)
+                applied += 1
+
+        self._refresh_orders()
+        self._refresh_account()
+        return applied
+
+    def _seed(self) -> None:
+        now = int(time.time())
+        latest = self._latest_deals(now - self.lookback_days * 86400, now)
+        if latest is not None and not latest[1]:
+            # Nothing recent, so find the latest deal in the whole history
+            latest = self._latest_deals(0, now)
+
+        for _ in range(SEED_ATTEMPTS):
+            if latest is None:
+                break
+            positions = mt5.positions_get()
+
+            # A deal made while the snapshot was taken may or may not be in it, so
+            # only accept the snapshot if the latest deals are unchanged afterwards
+            check = self._latest_deals(latest[0] // 1000, now)
+            if positions is not None and check == latest:
+                self._load(positions, *latest)
+                return
+            latest = check
+
+        logger.warning("Could not take a consistent positions snapshot, the account state will be seeded again")
+        self.cursor_msc = None
+
+    @staticmethod
+    def _latest_deals(date_from: int, now: int) -> tuple[int, set[int]] | None:
+        # Time of the latest deal since date_from and the tickets of every deal at that time
+        deals = mt5.history_deals_get(date_from, now + SERVER_CLOCK_MARGIN)
+        if deals is None:
+            logger.warning(f"Could not get deal history: {mt5.last_error()}")
+            return None
+        latest = max((deal.time_msc for deal in deals), default=0)
+        return latest, {deal.ticket for deal in deals if deal.time_msc == latest}
+
+    def _load(self, positions, cursor_msc: int, seen: set[int]) -> None:
+        self.positions.clear()
+        self.symbol_volume.clear()
+        self.magic_volume.clear()
+        self.currency_exposure.clear()
+
+        # Deals refer to positions by their identifier, which is not always the position ticket
+        for position in positions:
+            signed = position.volume if position.type == mt5.POSITION_TYPE_BUY else -position.volume
+            self._apply(position.identifier, position.symbol, position.magic, signed, position.price_open)
+
+        # An account without any deal keeps a cursor of 0, which also only finds new deals
+        self.cursor_msc = cursor_msc
+        self._seen_at_cursor = seen
+        logger.info(f"Account state seeded with {len(self.positions)} open positions")
+
+    def _refresh_orders(self) -> None:
+        orders = mt5.orders_get()
+        if orders is None:
+            logger.warning(f"Could not get pending orders: {mt5.last_error()}")
+            return
+
+        self.pending_volume.clear()
+        self.pending_magic_volume.clear()
+        self.pending_exposure.clear()
+        for order in orders:
+            if order.type in PENDING_BUY_TYPES:
+                signed = order.volume_current
+            elif order.type in PENDING_SELL_TYPES:
+                signed = -order.volume_current
+            else:
+                continue
+
+            buy = signed > 0
+            key = (order.symbol, buy)
+            magic_key = (order.magic, order.symbol, buy)
+            self.pending_volume[key] = round(self.pending_volume.get(key, 0.0) + signed, 8)
+            self.pending_magic_volume[magic_key] = round(self.pending_magic_volume.get(magic_key, 0.0) + signed, 8)
+
+            # Keyed by currency and direction, as only the orders on the side of a new order add to its risk
+            base, quote, contract_size = self._symbol_info(order.symbol)
+            units = signed * contract_size
+            self.pending_exposure[(base, buy)] = self.pending_exposure.get((base, buy), 0.0) + units
+            self.pending_exposure[(quote, not buy)] = (
+                self.pending_exposure.get((quote, not buy), 0.0) - units * order.price_open
+            )
+
+    def _refresh_account(self) -> None:
+        account_info = mt5.account_info()
+        if account_info is None:
+            logger.warning(f"Could not get account info: {mt5.last_error()}")
+            return
+        self.balance = account_info.balance
+        self.equity = account_info.equity
+        self.margin = account_info.margin
+        self.margin_free = account_info.margin_free
+
+    def _symbol_info(self, symbol: str) -> tuple[str, str, float]:
+        # Currencies and contract size do not change, so look them up once per symbol
+        if symbol not in self._symbols:
+            info = mt5.symbol_info(symbol)
+            self._symbols[symbol] = (info.currency_base, info.currency_profit, info.trade_contract_size)
+        return self._symbols[symbol]
+
+    def _apply(self, position_id: int, symbol: str, magic: int, signed: float, price: float) -> None:
+        position = self.positions.get(position_id)
+        if position is None:
+            position = {"symbol": symbol, "magic": magic, "volume": 0.0, "price_open": price, "notional": 0.0}
+            self.positions[position_id] = position
+
+        base, quote, contract_size = self._symbol_info(symbol)
+        previous = position["volume"]
+        previous_notional = position["notional"]
+        volume = round(previous + signed, 8)
+
+        # Notional is the signed quote amount of the open volume, valued at the open price
+        if previous == 0 or (previous > 0) == (signed > 0):
+            notional = previous_notional + signed * contract_size * price
+        elif volume != 0 and (volume > 0) == (previous > 0):
+            notional = previous_notional * volume / previous
+        else:
+            notional = volume * contract_size * price
+
+        position["volume"] = volume
+        position["notional"] = notional
+        if volume == 0:
+            del self.positions[position_id]
+        elif previous == 0 or (previous > 0) != (volume > 0):
+            # New or reversed (netting accounts) position
+            position["price_open"] = price
+
+        # Closing deals may carry a different magic number, so use the opening one
+        key = (position["magic"], symbol)
+        self.symbol_volume[symbol] = round(self.symbol_volume.get(symbol, 0.0) + signed, 8)
+        self.magic_volume[key] = round(self.magic_volume.get(key, 0.0) + signed, 8)
+
+        # Only open positions count, so realized PnL does not accumulate in the quote currency
+        self.currency_exposure[base] = self.currency_exposure.get(base, 0.0) + signed * contract_size
+        self.currency_exposure[quote] = self.currency_exposure.get(quote, 0.0) - (notional - previous_notional)
+
+    def get_balance(self) -> float:
+        return self.balance
+
+    def count_positions(self, symbol=None, position_type=None, magic=None) -> int:
+        total = 0
+        for position in self.positions.values():
+            if symbol and position["symbol"] != symbol:
+                continue
+            if magic is not None and position["magic"] != magic:
+                continue
+            if position_type is not None and position_type != self._position_type(position):
+                continue
+            total += 1
+        return total
+
+    def get_positions(self, symbol=None, position_type=None) -> pd.DataFrame:
+        rows = [
+            {
+                "ticket": identifier,
+                "symbol": position["symbol"],
+                "type": self._position_type(position),
+                "volume": abs(position["volume"]),
+                "magic": position["magic"],
+                "price_open": position["price_open"],
+            }
+            for identifier, position in self.positions.items()
+            if (not symbol or position["symbol"] == symbol)
+            and (position_type is None or self._position_type(position) == position_type)
+        ]
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _position_type(position: dict) -> int:
+        return mt5.POSITION_TYPE_BUY if position["volume"] > 0 else mt5.POSITION_TYPE_SELL
+
+    def get_net_volume(self, symbol: str, magic=None) -> float:
+        if magic is None:
+            return self.symbol_volume.get(symbol, 0.0)
+        return self.magic_volume.get((magic, symbol), 0.0)
+
+    def get_currency_exposure(self, currency: str) -> float:
+        return self.currency_exposure.get(currency, 0.0)
+
+    def get_pending_volume(self, symbol: str, position_type: int, magic=None) -> float:
+        buy = position_type == mt5.ORDER_TYPE_BUY
+        if magic is None:
+            return self.pending_volume.get((symbol, buy), 0.0)
+        return self.pending_magic_volume.get((magic, symbol, buy), 0.0)
+
+    def check_exposure(self, symbol: str, volume: float, position_type: int, magic=None, price=None,
+                       max_symbol_volume=None, max_magic_volume=None, max_currency_exposure=None) -> bool:
+        """
+        Check whether an order would keep the account within its exposure limits.
+
+        Pending orders on the same side as the order are counted as filled.
+
+        Args:
+            - symbol (str): Symbol of the order.
+            - volume (float): Order volume in lots.
+            - position_type (int): mt5.ORDER_TYPE_BUY or mt5.ORDER_TYPE_SELL.
+            - magic (int): Magic number of the robot placing the order.
+            - price (float): Expected fill price, used to check the quote currency. Skipped when not given.
+            - max_symbol_volume (float): Limit on the absolute net volume of the symbol, in lots.
+            - max_magic_volume (float): Limit on the absolute net volume of the symbol for this robot, in lots.
+            - max_currency_exposure (float): Limit on the absolute net exposure of each currency of the symbol.
+
+        Returns:
+            bool: True if no limit would be exceeded.
+        """
+        buy = position_type == mt5.ORDER_TYPE_BUY
+        signed = volume if buy else -volume
+
+        if max_symbol_volume is not None:
+            pending = self.get_pending_volume(symbol, position_type)
+            if abs(self.get_net_volume(symbol) + pending + signed) > max_symbol_volume:
+                return False
+
+        if max_magic_volume is not None and magic is not None:
+            pending = self.get_pending_volume(symbol, position_type, magic)
+            if abs(self.get_net_volume(symbol, magic) + pending + signed) > max_magic_volume:
+                return False
+
+        if max_currency_exposure is not None:
+            base, quote, contract_size = self._symbol_info(symbol)
+            units = signed * contract_size
+            base_exposure = self.get_currency_exposure(base) + self.pending_exposure.get((base, buy), 0.0)
+            if abs(base_exposure + units) > max_currency_exposure:
+                return False
+            if price is not None:
+                quote_exposure = self.get_currency_exposure(quote) + self.pending_exposure.get((quote, not buy), 0.0)
+                if abs(quote_exposure - units * price) > max_currency_exposure:
+                    return False
+
+        return True
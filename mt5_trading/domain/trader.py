@@ -2,10 +2,14 @@ import MetaTrader5 as mt5
 import pandas as pd
 from loguru import logger
 
-from mt5_trading.adapters import Trader
+from mt5_trading.adapters import Trader, AccountState
 
 
 class MT5Trader(Trader):
+    def __init__(self, account_state: AccountState | None = None):
+        # When set, position counts and the balance come from the local state instead of the terminal
+        self.account_state = account_state
+
     def open_position(self, symbol, volume, position_type, comment, magic_number, sl=None, tp=None):
         # Base order dictionary with common parameters
         order = {
@@ -32,6 +36,9 @@ class MT5Trader(Trader):
             logger.error("Please enable AutoTrading: Tools -> Options -> Expert Advisors -> Allow Automated Trading")
             return None
 
+        if self.account_state is not None:
+            self.account_state.sync()
+
         return result
 
     def close_positions(self, robot_name: str, symbol=None, position_type=None):
@@ -82,7 +89,14 @@ class MT5Trader(Trader):
                     }
                     mt5.order_send(close_request)
 
+            if self.account_state is not None:
+                self.account_state.sync()
+
     def get_opened_positions(self, symbol=None, position_type=None):
+        if self.account_state is not None:
+            df = self.account_state.get_positions(symbol, position_type)
+            return len(df), df
+
         try:
             opened_positions = mt5.positions_get()
             df_opened_positions = pd.DataFrame(list(opened_positions), columns=opened_positions[0]._asdict().keys())
@@ -161,7 +175,10 @@ class MT5Trader(Trader):
         current_price = (symbol_info_tick.bid + symbol_info_tick.ask) / 2
         tick_size = symbol_info.trade_tick_size
 
-        balance = mt5.account_info().balance
+        if self.account_state is not None:
+            balance = self.account_state.get_balance()
+        else:
+            balance = mt5.account_info().balance
         risk_per_trade = per_to_risk
         ticks_at_risk = abs(current_price - stop_loss) / tick_size
         tick_value = symbol_info.trade_tick_value
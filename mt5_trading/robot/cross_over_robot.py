@@ -1,7 +1,7 @@
 import MetaTrader5 as mt5
 from loguru import logger
 
-from mt5_trading.adapters import Trader, TradingStrategy
+from mt5_trading.adapters import AccountState, Trader, TradingStrategy
 
 
 class CrossOverRobot:
@@ -12,6 +12,10 @@ class CrossOverRobot:
         - volume (float): The trading volume for each position.
         - trader (Trader): The trader instance responsible for executing trades.
         - strategy (TradingStrategy): The trading strategy instance guiding the robot's decisions.
+        - magic_number (int): A unique identifier for trades opened by the robot.
+        - name (str): The name of the robot.
+        - account_state (AccountState): Local account state used for the exposure check.
+        - exposure_limits (dict): Keyword limits passed to AccountState.check_exposure before each new position.
 
     Attributes:
         - volume (float): The trading volume for each position.
@@ -19,9 +23,12 @@ class CrossOverRobot:
         - strategy (TradingStrategy): The trading strategy instance guiding the robot's decisions.
         - magic_number (int): A unique identifier for trades opened by the robot.
         - name (str): The name of the robot.
+        - account_state (AccountState): Local account state used for the exposure check.
+        - exposure_limits (dict): Keyword limits passed to AccountState.check_exposure before each new position.
 
     Methods:
         - trade(): Executes the trading logic based on the strategy's signals.
+        - within_exposure_limits(): Checks a new position against the exposure limits.
 
     Example usage:
     ```python
@@ -33,7 +40,9 @@ class CrossOverRobot:
     ```
     """
 
-    def __init__(self, volume: float, trader: Trader, strategy: TradingStrategy):
+    def __init__(self, volume: float, trader: Trader, strategy: TradingStrategy,
+                 magic_number: int = 20240100, name: str = 'Cross Over',
+                 account_state: AccountState | None = None, exposure_limits: dict | None = None):
         """
         Initializes the CrossOverRobot instance.
 
@@ -41,14 +50,48 @@ class CrossOverRobot:
             - volume (float): The trading volume for each position.
             - trader (Trader): The trader instance responsible for executing trades.
             - strategy (TradingStrategy): The trading strategy instance guiding the robot's decisions.
+            - magic_number (int): A unique identifier for trades opened by the robot.
+            - name (str): The name of the robot.
+            - account_state (AccountState): Local account state used for the exposure check.
+            - exposure_limits (dict): Keyword limits passed to AccountState.check_exposure before each new position.
         """
         self.volume = volume
         self.trader = trader
         self.strategy = strategy
-        self.magic_number = 20240100
-        self.name = 'Cross Over'
+        self.magic_number = magic_number
+        self.name = name
+        self.account_state = account_state
+        self.exposure_limits = exposure_limits or {}
         logger.info("Starting CrossOver Robot")
 
+    def within_exposure_limits(self, symbol: str, position_type: int) -> bool:
+        """
+        Checks whether a new position would keep the account within the exposure limits.
+
+        Args:
+            - symbol (str): Symbol of the new position.
+            - position_type (int): mt5.ORDER_TYPE_BUY or mt5.ORDER_TYPE_SELL.
+
+        Returns:
+            bool: True if there are no limits or none would be exceeded.
+        """
+        if self.account_state is None or not self.exposure_limits:
+            return True
+
+        price = None
+        if "max_currency_exposure" in self.exposure_limits:
+            tick = mt5.symbol_info_tick(symbol)
+            if tick is not None:
+                price = tick.ask if position_type == mt5.ORDER_TYPE_BUY else tick.bid
+
+        if self.account_state.check_exposure(
+            symbol, self.volume, position_type, magic=self.magic_number, price=price, **self.exposure_limits
+        ):
+            return True
+
+        logger.warning(f"Skipping {symbol} position: it would exceed the exposure limits {self.exposure_limits}")
+        return False
+
     def trade(self):
         """
         Executes the trading logic based on the strategy's signals.
@@ -58,7 +101,7 @@ class CrossOverRobot:
 
         if signal == signal.BUY:
             total_buy, _ = self.trader.get_opened_positions(symbol, mt5.ORDER_TYPE_BUY)
-            if total_buy == 0:
+            if total_buy == 0 and self.within_exposure_limits(symbol, mt5.ORDER_TYPE_BUY):
                 logger.info(f"Buying signal detected for {symbol}")
                 result = self.trader.open_position(
                     symbol,
@@ -79,7 +122,7 @@ class CrossOverRobot:
 
         elif signal == signal.SELL:
             total_sell, _ = self.trader.get_opened_positions(symbol, mt5.ORDER_TYPE_SELL)
-            if total_sell == 0:
+            if total_sell == 0 and self.within_exposure_limits(symbol, mt5.ORDER_TYPE_SELL):
                 logger.info(f"Selling signal detected for {symbol}")
                 result = self.trader.open_position(
                     symbol,
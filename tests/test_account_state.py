@@ -0,0 +1,115 @@
+import sys
+import time
+import types
+import unittest
+from types import SimpleNamespace
+
+# MetaTrader5 only runs on Windows next to a terminal, so the tests use a small in-memory stand-in
+mt5 = types.ModuleType("MetaTrader5")
+mt5.DEAL_TYPE_BUY, mt5.DEAL_TYPE_SELL = 0, 1
+mt5.POSITION_TYPE_BUY, mt5.POSITION_TYPE_SELL = 0, 1
+mt5.ORDER_TYPE_BUY, mt5.ORDER_TYPE_SELL = 0, 1
+mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_SELL_LIMIT = 2, 3
+mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_SELL_STOP = 4, 5
+mt5.ORDER_TYPE_BUY_STOP_LIMIT, mt5.ORDER_TYPE_SELL_STOP_LIMIT = 6, 7
+mt5.deals = []
+mt5.positions = []
+mt5.orders = []
+mt5.history_deals_get = lambda date_from, date_to: tuple(
+    deal for deal in mt5.deals if date_from <= deal.time_msc // 1000 <= date_to
+)
+mt5.positions_get = lambda: tuple(mt5.positions)
+mt5.orders_get = lambda: tuple(mt5.orders)
+mt5.symbol_info = lambda symbol: SimpleNamespace(
+    currency_base=symbol[:3], currency_profit=symbol[3:], trade_contract_size=100000
+)
+mt5.account_info = lambda: SimpleNamespace(balance=10000.0, equity=10000.0, margin=0.0, margin_free=10000.0)
+mt5.last_error = lambda: (1, "Success")
+sys.modules["MetaTrader5"] = mt5
+
+from mt5_trading.domain.account_state import MT5AccountState  # noqa: E402
+
+NOW_MSC = int(time.time()) * 1000
+DAY_MSC = 86400 * 1000
+
+
+def make_deal(ticket, time_msc, position_id, volume, deal_type=0, price=1.1, magic=1):
+    return SimpleNamespace(ticket=ticket, time_msc=time_msc, position_id=position_id, symbol="EURUSD",
+                           magic=magic, volume=volume, type=deal_type, price=price)
+
+
+def make_position(identifier, ticket, volume, time_msc, price=1.1, magic=1):
+    return SimpleNamespace(identifier=identifier, ticket=ticket, symbol="EURUSD", magic=magic, volume=volume,
+                           type=mt5.POSITION_TYPE_BUY, price_open=price, time_update_msc=time_msc)
+
+
+class MT5AccountStateTest(unittest.TestCase):
+    def setUp(self):
+        mt5.deals = []
+        mt5.positions = []
+        mt5.orders = []
+
+    def test_restart_with_position_older_than_lookback(self):
+        opened = NOW_MSC - 3 * DAY_MSC
+        mt5.deals = [make_deal(11, opened, 7, 1.0)]
+        # The position ticket differs from its identifier, which is what deals refer to
+        mt5.positions = [make_position(7, 8, 1.0, opened)]
+
+        state = MT5AccountState()
+        state.sync()
+        self.assertEqual(state.symbol_volume, {"EURUSD": 1.0})
+        self.assertEqual(state.cursor_msc, opened)
+
+        self.assertEqual(state.sync(), 0)
+        self.assertEqual(state.symbol_volume, {"EURUSD": 1.0})
+        self.assertEqual(state.get_currency_exposure("EUR"), 100000)
+
+        # Closing the position applies to the same entry
+        mt5.deals.append(make_deal(12, NOW_MSC, 7, 1.0, deal_type=mt5.DEAL_TYPE_SELL, price=1.2))
+        mt5.positions = []
+        self.assertEqual(state.sync(), 1)
+        self.assertEqual(state.positions, {})
+        self.assertEqual(state.symbol_volume, {"EURUSD": 0.0})
+        self.assertAlmostEqual(state.get_currency_exposure("EUR"), 0.0)
+        self.assertAlmostEqual(state.get_currency_exposure("USD"), 0.0)
+
+    def test_deal_during_snapshot_is_counted_once(self):
+        opened = NOW_MSC - DAY_MSC // 2
+        mt5.deals = [make_deal(11, opened, 7, 1.0)]
+        mt5.positions = [make_position(7, 7, 1.0, opened)]
+
+        # A second position fills right after the positions snapshot is taken
+        positions_get = mt5.positions_get
+
+        def positions_then_deal():
+            snapshot = positions_get()
+            if len(mt5.deals) == 1:
+                mt5.deals.append(make_deal(12, opened + 1000, 9, 0.5))
+                mt5.positions.append(make_position(9, 9, 0.5, opened + 1000))
+            return snapshot
+
+        mt5.positions_get = positions_then_deal
+        try:
+            state = MT5AccountState()
+            state.sync()
+        finally:
+            mt5.positions_get = positions_get
+
+        self.assertEqual(state.cursor_msc, opened + 1000)
+        self.assertEqual(state.sync(), 0)
+        self.assertEqual(state.symbol_volume, {"EURUSD": 1.5})
+
+    def test_pending_orders_count_towards_exposure(self):
+        mt5.orders = [SimpleNamespace(ticket=21, symbol="EURUSD", magic=1, type=mt5.ORDER_TYPE_BUY_LIMIT,
+                                      volume_current=0.5, price_open=1.09)]
+        state = MT5AccountState()
+        state.sync()
+
+        self.assertEqual(state.get_pending_volume("EURUSD", mt5.ORDER_TYPE_BUY), 0.5)
+        self.assertFalse(state.check_exposure("EURUSD", 0.6, mt5.ORDER_TYPE_BUY, max_symbol_volume=1.0))
+        self.assertTrue(state.check_exposure("EURUSD", 0.6, mt5.ORDER_TYPE_SELL, max_symbol_volume=1.0))
+        self.assertFalse(state.check_exposure("EURUSD", 0.6, mt5.ORDER_TYPE_BUY, max_currency_exposure=100000))
+
+
+if __name__ == "__main__":
+    unittest.main()